@@ -1,153 +1,407 @@
 import streamlit as st
-import requests
-import wikipedia
-from datetime import datetime, timedelta
-import json
+import requests_cache
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import wraps
+from urllib.parse import quote, quote_plus
+from models import APIError, FDAResult, DrugCentralResult, DailyMedLabel, ChEMBLMolecule
 
-# Configure Wikipedia
-wikipedia.set_lang("en")
+# Must be the first Streamlit command, ahead of any cached call that could render
+st.set_page_config(
+    page_title="Pharma API Explorer",
+    page_icon="💊",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Seconds a result counts as fresh, and how long a stale one may still be served.
+# The sqlite transport cache keeps responses for the whole stale window (so restarts
+# start warm); swr_cache revalidation bypasses it with force_refresh.
+FRESH_SECONDS = 600
+STALE_SECONDS = 86400
+
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    """Process-wide HTTP session; pooled across reruns, sqlite-cached across restarts"""
+    session = requests_cache.CachedSession(
+        "pharma_cache",
+        backend="sqlite",
+        expire_after=STALE_SECONDS,
+        allowable_codes=[200],
+        cache_control=False,
+    )
+    # Runs once per process: drop rows left expired by earlier runs
+    session.cache.delete(expired=True)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=1, backoff_factor=0.1, status_forcelist=[502, 503, 504], allowed_methods=["GET"])
+    ))
+    session.headers["User-Agent"] = "PharmaChatbot/1.0 (+https://github.com/SaleemDM/pharma-chatbot)"
+    return session
+
+# ======================
+# STALE-WHILE-REVALIDATE CACHE
+# ======================
+
+@st.cache_resource(show_spinner=False)
+def _swr_state(name):
+    """LRU-ordered entries, in-flight refreshes and a lock for one function, shared across reruns"""
+    return OrderedDict(), set(), threading.Lock()
+
+@st.cache_resource(show_spinner=False)
+def _swr_refresh_pool():
+    return ThreadPoolExecutor(max_workers=8)
+
+def _swr_put(state, args, value, max_entries):
+    entries, _, lock = state
+    with lock:
+        entries[args] = (value, time.time())
+        entries.move_to_end(args)
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+
+def _swr_refresh(func, state, args, max_entries):
+    _, refreshing, lock = state
+    try:
+        _swr_put(state, args, func(*args, refresh=True), max_entries)
+    finally:
+        with lock:
+            refreshing.discard(args)
+
+def swr_cache(fresh, stale, max_entries=256):
+    """Cache results for `fresh` seconds, then serve them for up to `stale`
+    seconds while a background thread fetches a replacement, calling the
+    function with refresh=True so it can bypass lower caches. At most
+    `max_entries` results are kept, least recently used evicted first."""
+    def decorator(func):
+        def lookup(*args):
+            """Cached value (refreshing it in the background once stale), or None on a miss"""
+            state = _swr_state(func.__qualname__)
+            entries, refreshing, lock = state
+            with lock:
+                entry = entries.get(args)
+                if entry is None:
+                    return None
+                value, inserted_at = entry
+                age = time.time() - inserted_at
+                if age >= stale:
+                    del entries[args]
+                    return None
+                entries.move_to_end(args)
+                if age < fresh or args in refreshing:
+                    return value
+                refreshing.add(args)
+            _swr_refresh_pool().submit(_swr_refresh, func, state, args, max_entries)
+            return value
+
+        def store(value, *args):
+            _swr_put(_swr_state(func.__qualname__), args, value, max_entries)
+
+        @wraps(func)
+        def wrapper(*args):
+            value = lookup(*args)
+            if value is None:
+                value = func(*args)
+                store(value, *args)
+            return value
+
+        wrapper.lookup, wrapper.store = lookup, store
+        return wrapper
+    return decorator
+
+# ======================
+# FETCH ERRORS
+# ======================
+
+def api_errors(label):
+    """Re-raise anything but APIError from the wrapped fetcher as APIError("<label>: ...")"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except APIError:
+                raise
+            except Exception as e:
+                raise APIError(f"{label}: {str(e)}", transient=True) from None
+        return wrapper
+    return decorator
 
 # ======================
 # API INTEGRATION FUNCTIONS
 # ======================
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def fetch_rxnav_info(drug_name):
+# Fetchers take the drug name already URL-encoded (see _submit_fetches), and
+# refresh=True to skip the transport cache when revalidating
+
+# (connect, read) seconds; fail fast so one slow source can't hold its panel for long
+TIMEOUT = (2, 4)
+
+def _json(response):
+    """Decode a JSON body with orjson; empty bodies decode to {}"""
+    return orjson.loads(response.content) if response.content else {}
+
+@api_errors("RxNav Error")
+def fetch_rxnav_info(query, refresh=False):
     """RxNav API - Drug names and RxCUI identifiers"""
-    try:
-        url = f"https://rxnav.nlm.nih.gov/REST/drugs.json?name={drug_name}"
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        concepts = data.get("drugGroup", {}).get("conceptGroup", [])
-        return [f"{c['name']} (RxCUI: {c['rxcui']})" 
-                for group in concepts if group.get("conceptProperties") 
-                for c in group["conceptProperties"]]
-    except Exception as e:
-        return [f"RxNav Error: {str(e)}"]
-
-@st.cache_data(ttl=3600)
-def fetch_openfda_info(drug_name):
+    url = f"https://rxnav.nlm.nih.gov/REST/drugs.json?name={query}"
+    response = get_http_session().get(url, timeout=TIMEOUT, force_refresh=refresh)
+    response.raise_for_status()
+    data = _json(response)
+    concepts = data.get("drugGroup", {}).get("conceptGroup", [])
+    return [f"{c['name']} (RxCUI: {c['rxcui']})" 
+            for group in concepts if group.get("conceptProperties") 
+            for c in group["conceptProperties"]]
+
+@api_errors("FDA API Error")
+def fetch_openfda_info(query, refresh=False):
     """OpenFDA API - Labeling information"""
-    try:
-        url = "https://api.fda.gov/drug/label.json"
-        params = {"search": f"openfda.generic_name:{drug_name.lower()}", "limit": 1}
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
-        if not data.get("results"):
-            return {"error": "No FDA label data found"}
-        
-        result = data["results"][0]
-        return {
-            "uses": result.get("indications_and_usage", ["Not available"])[0],
-            "warnings": result.get("warnings", ["Not available"])[0],
-            "side_effects": result.get("adverse_reactions", ["Not available"])[0]
-        }
-    except Exception as e:
-        return {"error": f"FDA API Error: {str(e)}"}
-
-@st.cache_data(ttl=3600)
-def fetch_drugcentral_info(drug_name):
+    url = f"https://api.fda.gov/drug/label.json?search=openfda.generic_name:{query}&limit=1"
+    response = get_http_session().get(url, timeout=TIMEOUT, force_refresh=refresh)
+    if response.status_code == 404:  # OpenFDA's answer to a search with no matches
+        raise APIError("No FDA label data found")
+    response.raise_for_status()
+    data = _json(response)
+    if not data.get("results"):
+        raise APIError("No FDA label data found")
+    
+    result = data["results"][0]
+    return FDAResult(
+        uses=result.get("indications_and_usage", ["Not available"])[0],
+        warnings=result.get("warnings", ["Not available"])[0],
+        side_effects=result.get("adverse_reactions", ["Not available"])[0]
+    )
+
+@st.cache_data(ttl=86400, max_entries=1024, show_spinner=False)
+def _drugcentral_id_for(query, _refresh=False):
+    """DrugCentral struct_id for a name; IDs are stable, so skip the search on repeats.
+
+    Not-found raises rather than returning None: st.cache_data doesn't keep exceptions,
+    so a miss isn't pinned for a day (fetch_all still caches it like any result).
+    `_refresh` is left out of the cache key; it only affects the search a miss makes."""
+    search_url = f"https://drugcentral.org/api/v1/drugs?q={query}"
+    search_resp = get_http_session().get(search_url, timeout=TIMEOUT, force_refresh=_refresh)
+    search_resp.raise_for_status()
+    search_data = _json(search_resp)
+    if not search_data:
+        raise APIError("Drug not found in DrugCentral")
+    return search_data[0]["struct_id"]
+
+@api_errors("DrugCentral Error")
+def fetch_drugcentral_info(query, refresh=False):
     """DrugCentral - Pharmacological data"""
-    try:
-        search_url = f"https://drugcentral.org/api/v1/drugs?q={drug_name}"
-        search_resp = requests.get(search_url, timeout=10)
-        search_data = search_resp.json()
-        
-        if not search_data:
-            return {"error": "Drug not found in DrugCentral"}
-        
-        drug_id = search_data[0]["struct_id"]
-        detail_url = f"https://drugcentral.org/api/v1/drug/{drug_id}"
-        detail_resp = requests.get(detail_url, timeout=10)
-        detail_data = detail_resp.json()
-        
-        return {
-            "moa": detail_data.get("mechanism_of_action", "Not available"),
-            "targets": [t["target_name"] for t in detail_data.get("targets", [])[:3]],
-            "indications": [i["indication"] for i in detail_data.get("indications", [])[:2]]
-        }
-    except Exception as e:
-        return {"error": f"DrugCentral Error: {str(e)}"}
-
-@st.cache_data(ttl=3600)
-def fetch_wikipedia_summary(drug_name):
+    drug_id = _drugcentral_id_for(query, _refresh=refresh)
+    
+    detail_url = f"https://drugcentral.org/api/v1/drug/{drug_id}"
+    detail_resp = get_http_session().get(detail_url, timeout=TIMEOUT, force_refresh=refresh)
+    detail_resp.raise_for_status()
+    detail_data = _json(detail_resp)
+    
+    return DrugCentralResult(
+        moa=detail_data.get("mechanism_of_action", "Not available"),
+        targets=[t["target_name"] for t in detail_data.get("targets", [])[:3]],
+        indications=[i["indication"] for i in detail_data.get("indications", [])[:2]]
+    )
+
+@api_errors("Wikipedia Error")
+def fetch_wikipedia_summary(query, refresh=False):
     """Wikipedia - General drug summary"""
-    try:
-        search_results = wikipedia.search(drug_name)
-        if not search_results:
-            return "No Wikipedia page found"
-        return wikipedia.summary(search_results[0], sentences=3)
-    except Exception as e:
-        return f"Wikipedia Error: {str(e)}"
-
-@st.cache_data(ttl=3600)
-def fetch_dailymed_info(drug_name):
+    # One action-API request searches (case-insensitively, following redirects) and
+    # returns the top hit's intro, so the lower-cased query still finds e.g. "ACE inhibitor"
+    url = ("https://en.wikipedia.org/w/api.php?action=query&format=json&formatversion=2"
+           f"&generator=search&gsrsearch={query}&gsrlimit=1&redirects=1"
+           "&prop=extracts&exintro=1&explaintext=1&exsentences=3")
+    response = get_http_session().get(url, timeout=TIMEOUT, force_refresh=refresh)
+    response.raise_for_status()
+    data = _json(response)
+    if "error" in data:
+        raise RuntimeError(data["error"].get("info", "API error"))
+    pages = data.get("query", {}).get("pages", [])
+    if not pages:
+        return "No Wikipedia page found"
+    return pages[0].get("extract") or "No Wikipedia page found"
+
+@api_errors("DailyMed Error")
+def fetch_dailymed_info(query, refresh=False):
     """DailyMed - Structured product labels"""
-    try:
-        url = "https://dailymed.nlm.nih.gov/dailymed/services/v2/spls.json"
-        params = {"drug_name": drug_name, "pagesize": 2}
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
-        return [{
-            "title": item.get("title", "No title"),
-            "url": f"https://dailymed.nlm.nih.gov/dailymed/drugInfo.cfm?setid={item.get('setid')}"
-        } for item in data.get("data", [])[:2]] or ["No DailyMed entries found"]
-    except Exception as e:
-        return [f"DailyMed Error: {str(e)}"]
-
-@st.cache_data(ttl=3600)
-def fetch_chembl_info(drug_name):
+    url = f"https://dailymed.nlm.nih.gov/dailymed/services/v2/spls.json?drug_name={query}&pagesize=2"
+    response = get_http_session().get(url, timeout=TIMEOUT, force_refresh=refresh)
+    response.raise_for_status()
+    data = _json(response)
+    return [DailyMedLabel(
+        title=item.get("title", "No title"),
+        url=f"https://dailymed.nlm.nih.gov/dailymed/drugInfo.cfm?setid={item.get('setid')}"
+    ) for item in data.get("data", [])[:2]]
+
+@api_errors("ChEMBL Error")
+def fetch_chembl_info(query, refresh=False):
     """ChEMBL - Bioactivity data"""
+    # Only ask for the fields the panel shows; full molecule records are ~30KB each
+    url = (f"https://www.ebi.ac.uk/chembl/api/data/molecule/search.json?q={query}"
+           "&limit=3&only=pref_name,molecule_chembl_id,molecule_type")
+    response = get_http_session().get(url, timeout=TIMEOUT, force_refresh=refresh)
+    response.raise_for_status()
+    data = _json(response)
+    molecules = data.get("molecules", [])[:3]
+    if not molecules:
+        raise APIError("No ChEMBL records found")
+    return [ChEMBLMolecule(
+        name=mol.get("pref_name", "Unnamed compound"),
+        chembl_id=mol.get("molecule_chembl_id"),
+        type=mol.get("molecule_type")
+    ) for mol in molecules]
+
+FETCHERS = {
+    "wiki": fetch_wikipedia_summary,
+    "rxnav": fetch_rxnav_info,
+    "fda": fetch_openfda_info,
+    "dailymed": fetch_dailymed_info,
+    "dc": fetch_drugcentral_info,
+    "chembl": fetch_chembl_info,
+}
+
+@st.cache_resource(show_spinner=False)
+def _fetch_pool():
+    """Long-lived pool for the searches users are waiting on; never joined from the script thread"""
+    return ThreadPoolExecutor(max_workers=24)
+
+@st.cache_resource(show_spinner=False)
+def _background_fetch_pool():
+    """Smaller pool for warmup and revalidation, so they never queue ahead of a search"""
+    return ThreadPoolExecutor(max_workers=12)
+
+def _run_fetch(fetch, query, refresh):
     try:
-        url = f"https://www.ebi.ac.uk/chembl/api/data/molecule/search.json?q={drug_name}"
-        response = requests.get(url, timeout=10)
-        data = response.json()
-        molecules = data.get("molecules", [])[:3]
-        return [{
-            "name": mol.get("pref_name", "Unnamed compound"),
-            "chembl_id": mol.get("molecule_chembl_id"),
-            "type": mol.get("molecule_type")
-        } for mol in molecules] or [{"error": "No ChEMBL records found"}]
-    except Exception as e:
-        return [{"error": f"ChEMBL Error: {str(e)}"}]
+        return fetch(query, refresh=refresh)
+    except APIError as e:
+        # A fresh instance, so the cached result holds no traceback (or fetcher locals)
+        return APIError(str(e), transient=e.transient)
+
+def _is_transient(result):
+    return isinstance(result, APIError) and result.transient
+
+def _submit_fetches(drug_name, pool, on_done=None, refresh=False):
+    """Start every source concurrently on `pool`; returns {future: panel key}.
+
+    `on_done(results)` is called once all sources finish, even if the caller
+    has stopped waiting (e.g. a rerun interrupted the render loop)."""
+    query = quote_plus(drug_name)
+    futures = {pool.submit(_run_fetch, fetch, query, refresh): key for key, fetch in FETCHERS.items()}
+    if on_done is not None:
+        pending = [len(futures)]
+        lock = threading.Lock()
+        def collect(_):
+            with lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            on_done({key: future.result() for future, key in futures.items()})
+        for future in futures:
+            future.add_done_callback(collect)
+    return futures
+
+@swr_cache(fresh=FRESH_SECONDS, stale=STALE_SECONDS)  # Served stale for up to a day
+def fetch_all(drug_name, refresh=False):
+    """Results of every source; one cache entry per drug keeps panels in sync.
+
+    Called only off the script thread (warmup, revalidation), so it fetches on the
+    background pool; iter_fetch_all serves searches."""
+    results = {key: future.result() for future, key in _submit_fetches(drug_name, _background_fetch_pool(), refresh=refresh).items()}
+    failed = next((r for r in results.values() if _is_transient(r)), None)
+    if failed is not None:
+        raise failed  # Not cached; a stale entry being revalidated stays in place
+    return results
+
+def iter_fetch_all(drug_name):
+    """Stream fetch_all: replay its cache when warm, else yield panels as they arrive"""
+    cached = fetch_all.lookup(drug_name)
+    if cached is not None:
+        yield from cached.items()
+        return
+    def store(results):
+        if not any(_is_transient(r) for r in results.values()):
+            fetch_all.store(results, drug_name)
+    futures = _submit_fetches(drug_name, _fetch_pool(), on_done=store)
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+# Normalized (lower-case) names prefetched at startup so their first search is a cache hit
+POPULAR_DRUGS = [
+    "ibuprofen", "metformin", "aspirin", "lisinopril",
+    "atorvastatin", "amoxicillin", "omeprazole", "levothyroxine",
+]
+
+@st.cache_resource(show_spinner=False)
+def _warmup():
+    """Prefetch POPULAR_DRUGS in the background, once per process"""
+    executor = ThreadPoolExecutor(max_workers=4)
+    for drug in POPULAR_DRUGS:
+        executor.submit(fetch_all, drug)
+    return executor
+
+_warmup()
 
 # ======================
-# PLACEHOLDER APIS (NO AUTH)
+# EXTERNAL RESOURCES (NO AUTH)
 # ======================
 
-def fetch_who_atc_info(drug_name):
-    return {
-        "note": "Search WHO ATC/DDD Index:",
-        "link": f"https://www.whocc.no/atc_ddd_index/?name={drug_name}&search=Search"
-    }
-
-def fetch_goodrx_info(drug_name):
-    return {
-        "note": "Visit GoodRx for pricing:",
-        "link": f"https://www.goodrx.com/{drug_name.replace(' ', '-')}"
-    }
-
-def fetch_drugscom_info(drug_name):
-    return {
-        "note": "Search Drugs.com:",
-        "link": f"https://www.drugs.com/search.php?searchterm={drug_name}"
-    }
-
-def fetch_chemspider_info(drug_name):
-    return {
-        "note": "Search ChemSpider:",
-        "link": f"https://www.chemspider.com/Search.aspx?q={drug_name}"
-    }
+# Search links only; {q} is the URL-encoded query, {slug} the hyphenated form
+EXTERNAL_LINKS = [
+    ("WHO ATC/DDD Index", "https://www.whocc.no/atc_ddd_index/?name={q}&search=Search"),
+    ("GoodRx Pricing", "https://www.goodrx.com/{slug}"),
+    ("Drugs.com", "https://www.drugs.com/search.php?searchterm={q}"),
+    ("ChemSpider", "https://www.chemspider.com/Search.aspx?q={q}"),
+]
 
 # ======================
-# STREAMLIT UI
+# PANEL RENDERERS
 # ======================
 
-st.set_page_config(
-    page_title="Pharma API Explorer",
-    page_icon="💊",
-    layout="wide"
-)
+def render_fda(fda):
+    st.subheader("Uses")
+    st.write(fda.uses)
+    st.subheader("Warnings")
+    st.write(fda.warnings)
+
+def render_dailymed(labels):
+    for label in labels:
+        st.markdown(f"**{label.title}**")
+        st.markdown(f"[View Label]({label.url})")
+    if not labels:
+        st.write("No DailyMed entries found")
+
+def render_drugcentral(dc):
+    st.subheader("Mechanism of Action")
+    st.write(dc.moa)
+    if dc.targets:
+        st.subheader("Top Targets")
+        st.write(", ".join(dc.targets))
+
+def render_chembl(molecules):
+    for compound in molecules:
+        st.markdown(f"**{compound.name}**")
+        st.write(f"ChEMBL ID: {compound.chembl_id}")
+
+# Panel key -> (expander title, renderer); an APIError result is shown instead
+PANELS = {
+    "wiki": ("📚 Wikipedia Summary", st.write),
+    "rxnav": ("🏷️ RxNav/RxCUI Identifiers", st.write),
+    "fda": ("⚠️ FDA Label Information", render_fda),
+    "dailymed": ("📄 DailyMed SPL Information", render_dailymed),
+    "dc": ("🧪 DrugCentral Pharmacology", render_drugcentral),
+    "chembl": ("🔬 ChEMBL Bioactivity Data", render_chembl),
+}
+
+# ======================
+# STREAMLIT UI
+# ======================
 
 st.title("💊 Comprehensive Drug Information Tool")
 st.markdown("Search across 10+ pharmaceutical databases")
@@ -158,72 +412,29 @@ drug_query = st.text_input(
 )
 
 if drug_query:
+    drug_name = drug_query.strip().lower()
     with st.spinner("Gathering drug information from multiple sources..."):
         col1, col2 = st.columns(2)
         
-        with col1:
-            # Wikipedia Summary
-            with st.expander("📚 Wikipedia Summary", expanded=True):
-                st.write(fetch_wikipedia_summary(drug_query))
-            
-            # RxNav Identifiers
-            with st.expander("🏷️ RxNav/RxCUI Identifiers"):
-                st.write(fetch_rxnav_info(drug_query))
-            
-            # FDA Information
-            with st.expander("⚠️ FDA Label Information"):
-                fda_data = fetch_openfda_info(drug_query)
-                if isinstance(fda_data, dict):
-                    if "error" in fda_data:
-                        st.error(fda_data["error"])
-                    else:
-                        st.subheader("Uses")
-                        st.write(fda_data.get("uses"))
-                        st.subheader("Warnings")
-                        st.write(fda_data.get("warnings"))
-            
-            # DailyMed
-            with st.expander("📄 DailyMed SPL Information"):
-                dailymed_data = fetch_dailymed_info(drug_query)
-                if isinstance(dailymed_data, list):
-                    for item in dailymed_data:
-                        if isinstance(item, dict):
-                            st.markdown(f"**{item.get('title')}**")
-                            st.markdown(f"[View Label]({item.get('url')})")
-                        else:
-                            st.write(item)
+        # Reserve a slot per panel so each can paint as soon as its source answers
+        slots = {key: col1.empty() for key in ("wiki", "rxnav", "fda", "dailymed")}
+        slots.update({key: col2.empty() for key in ("dc", "chembl")})
         
         with col2:
-            # DrugCentral
-            with st.expander("🧪 DrugCentral Pharmacology"):
-                dc_data = fetch_drugcentral_info(drug_query)
-                if isinstance(dc_data, dict):
-                    if "error" in dc_data:
-                        st.error(dc_data["error"])
-                    else:
-                        st.subheader("Mechanism of Action")
-                        st.write(dc_data.get("moa"))
-                        if dc_data.get("targets"):
-                            st.subheader("Top Targets")
-                            st.write(", ".join(dc_data["targets"]))
-            
-            # ChEMBL
-            with st.expander("🔬 ChEMBL Bioactivity Data"):
-                chembl_data = fetch_chembl_info(drug_query)
-                if isinstance(chembl_data, list):
-                    for compound in chembl_data:
-                        if isinstance(compound, dict):
-                            st.markdown(f"**{compound.get('name')}**")
-                            st.write(f"ChEMBL ID: {compound.get('chembl_id')}")
-            
             # External Resources
             with st.expander("🌍 External Resources"):
-                st.markdown("**WHO ATC/DDD Index**")
-                who_data = fetch_who_atc_info(drug_query)
-                st.markdown(f"[{who_data['note']}]({who_data['link']})")
-                
-                st.markdown("**GoodRx Pricing**")
-                grx_data = fetch_goodrx_info(drug_query)
-                st.markdown(f"[{grx_data['note']}]({grx_data['link']})")
-
-    st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | Data cached for 1 hour")
+                q, slug = quote_plus(drug_name), quote(drug_name.replace(" ", "-"))
+                st.markdown("\n".join(
+                    f"- [{name}]({url.format(q=q, slug=slug)})" for name, url in EXTERNAL_LINKS
+                ))
+        
+        for key, data in iter_fetch_all(drug_name):
+            title, render = PANELS[key]
+            with slots[key].container():
+                with st.expander(title, expanded=(key == "wiki")):
+                    if isinstance(data, APIError):
+                        st.error(str(data))
+                    else:
+                        render(data)
+
+    st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | Data refreshed every 10 minutes")
@@ -0,0 +1,37 @@
+"""Result types shared by the fetchers and panels.
+
+They live outside main.py because Streamlit re-executes the script on every rerun,
+which would redefine the classes; cached results must keep matching isinstance."""
+
+from dataclasses import dataclass
+
+class APIError(Exception):
+    """A source failed or had nothing to show; rendered in place of its panel.
+
+    `transient` marks network/server failures, which are shown but never cached."""
+    def __init__(self, message, transient=False):
+        super().__init__(message)
+        self.transient = transient
+
+@dataclass(frozen=True, slots=True)
+class FDAResult:
+    uses: str
+    warnings: str
+    side_effects: str
+
+@dataclass(frozen=True, slots=True)
+class DrugCentralResult:
+    moa: str
+    targets: list
+    indications: list
+
+@dataclass(frozen=True, slots=True)
+class DailyMedLabel:
+    title: str
+    url: str
+
+@dataclass(frozen=True, slots=True)
+class ChEMBLMolecule:
+    name: str
+    chembl_id: str
+    type: str